@@ -3,4 +3,3 @@ Core contracts, models, and orchestration for the summarization framework.
 """
 
 __version__ = "0.1.0"
-
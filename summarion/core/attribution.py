@@ -0,0 +1,141 @@
+"""
+Packed structure-of-arrays attribution for summary results.
+
+Every AttributedPoint/Decision/Task/Event carries ``source_msg_ids`` as a
+list of small str objects — fine on the wire, but wasteful when
+post-processing iterates attribution across a whole result (deduplication,
+attribution validation, rollups). This module packs a result's attribution
+into one interned id table plus one ``array('I')`` of 4-byte indices per
+component: a fraction of the memory of per-component str lists and far
+better cache locality when scanning.
+
+The wire schema is unchanged; ``source_msg_ids: List[str]`` remains the
+model contract, and ``AttributionTable.ids_for`` maps indices back for any
+caller that needs the strings.
+"""
+
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+
+from summarion.core.models import Message, SummaryResult
+
+# SummaryResult fields whose items carry source_msg_ids, in a fixed order
+# so packed spans line up with the model's component lists.
+_COMPONENT_FIELDS: tuple[str, ...] = ("points", "decisions", "timeline", "tasks")
+
+
+class AttributionTable:
+    """Packed attribution for a single summary result.
+
+    Message ids are interned into one table per result; each component's
+    ``source_msg_ids`` becomes an ``array('I')`` of indices into that table.
+
+    Attributes:
+        id_table: Unique message ids, in first-seen order
+    """
+
+    __slots__ = ("id_table", "_index_of", "_spans")
+
+    def __init__(self) -> None:
+        self.id_table: list[str] = []
+        self._index_of: dict[str, int] = {}
+        self._spans: dict[str, list[array]] = {field: [] for field in _COMPONENT_FIELDS}
+
+    @classmethod
+    def from_result(cls, result: SummaryResult) -> "AttributionTable":
+        """Pack the attribution of a summary result.
+
+        Args:
+            result: Summary whose components carry source_msg_ids
+
+        Returns:
+            Packed attribution table
+        """
+        table = cls()
+        for field in _COMPONENT_FIELDS:
+            spans = table._spans[field]
+            for item in getattr(result, field) or ():
+                spans.append(array("I", (table._intern(mid) for mid in item.source_msg_ids or ())))
+        return table
+
+    def _intern(self, msg_id: str) -> int:
+        """Return the table index for a message id, adding it if new."""
+        idx = self._index_of.get(msg_id)
+        if idx is None:
+            idx = len(self.id_table)
+            self.id_table.append(sys.intern(msg_id))
+            self._index_of[msg_id] = idx
+        return idx
+
+    def indices_for(self, field: str, position: int) -> array:
+        """Packed index span for one component.
+
+        Args:
+            field: Component field name (points/decisions/timeline/tasks)
+            position: Index of the component within that field's list
+
+        Returns:
+            array('I') of indices into ``id_table``
+        """
+        return self._spans[field][position]
+
+    def ids_for(self, field: str, position: int) -> list[str]:
+        """Map one component's packed span back to message id strings.
+
+        Args:
+            field: Component field name (points/decisions/timeline/tasks)
+            position: Index of the component within that field's list
+
+        Returns:
+            Message ids in original order
+        """
+        table = self.id_table
+        return [table[i] for i in self._spans[field][position]]
+
+    def iter_spans(self) -> Iterator[tuple[str, int, array]]:
+        """Iterate all packed spans in component order.
+
+        Yields:
+            (field, position, array('I') of id-table indices)
+        """
+        for field in _COMPONENT_FIELDS:
+            for position, span in enumerate(self._spans[field]):
+                yield field, position, span
+
+    def referenced_ids(self) -> set[str]:
+        """All message ids referenced anywhere in the result."""
+        return set(self.id_table)
+
+
+def message_index(messages: list[Message]) -> dict[str, int]:
+    """Build an id -> position index for a message window.
+
+    Mode parsers that associate candidate ids back to messages must not
+    scan the window per id (O(N*M) string compares); build this once per
+    parse and every resolution is a single dict hit. Repeated
+    summarization of the same window never rebuilds it in practice, since
+    the Summarizer memoizes parse results per message-id key.
+
+    Args:
+        messages: Message window in order
+
+    Returns:
+        Mapping of message id to its position in the window
+    """
+    return {m.id: i for i, m in enumerate(messages)}
+
+
+def resolve_span(ids: Iterable[str], index: dict[str, int]) -> array:
+    """Resolve candidate ids to packed message positions.
+
+    Unknown ids (hallucinated attribution) are silently dropped.
+
+    Args:
+        ids: Candidate message ids from an LLM response
+        index: Window index from ``message_index``
+
+    Returns:
+        array('I') of positions into the message window
+    """
+    return array("I", (index[i] for i in ids if i in index))
@@ -6,30 +6,42 @@ must adhere to. These include:
 - ModeStrategy: for summarization modes
 - LLMClient: for LLM provider adapters
 - Store: for persistence backends
+
+The protocols are static-only (not ``runtime_checkable``): a runtime
+``isinstance(x, Protocol)`` check probes every method via ``hasattr`` and is
+measurably slow on hot paths. Dispatch instead goes through explicit
+registries (see ``register_store`` / ``get_store``), and any remaining
+structural check goes through ``conforms_to``, which caches its verdict per
+concrete type.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections.abc import Callable
+from typing import Any
+from weakref import WeakKeyDictionary
 
-from typing_extensions import Protocol, runtime_checkable
+from typing_extensions import Protocol
 
 from summarion.core.models import Message, SummaryResult
 
 
-@runtime_checkable
 class ModeStrategy(Protocol):
     """Protocol for summarization modes.
 
     A mode is responsible for:
     1. Generating prompts from messages
     2. Parsing LLM outputs into structured results
+
+    ``output_schema`` names the model the LLM response decodes into;
+    ``parse`` implementations should validate the raw text against it in
+    one pass (``output_schema.from_llm_output``) instead of ``json.loads``
+    followed by model construction.
     """
 
     mode_name: str
     mode_version: str
+    output_schema: type[SummaryResult]
 
-    @abstractmethod
-    def prompt(self, messages: List[Message]) -> str:
+    def prompt(self, messages: list[Message]) -> str:
         """Generate a prompt from a list of messages.
 
         Args:
@@ -38,9 +50,9 @@ class ModeStrategy(Protocol):
         Returns:
             Prompt string to send to LLM
         """
+        ...
 
-    @abstractmethod
-    def parse(self, output: str, messages: List[Message]) -> SummaryResult:
+    def parse(self, output: str, messages: list[Message]) -> SummaryResult:
         """Parse LLM output into structured summary.
 
         Args:
@@ -50,29 +62,9 @@ class ModeStrategy(Protocol):
         Returns:
             Structured summary result
         """
-
-
-class BaseModeStrategy(ABC):
-    """Base class for mode strategies.
-
-    Provides common functionality and defaults.
-    """
-
-    mode_name: str
-    mode_version: str = "1"
-
-    @abstractmethod
-    def prompt(self, messages: List[Message]) -> str:
-        """Generate a prompt from a list of messages."""
-        ...
-
-    @abstractmethod
-    def parse(self, output: str, messages: List[Message]) -> SummaryResult:
-        """Parse LLM output into structured summary."""
         ...
 
 
-@runtime_checkable
 class LLMClient(Protocol):
     """Protocol for LLM provider clients.
 
@@ -82,14 +74,13 @@ class LLMClient(Protocol):
     3. Handling errors (rate limits, timeouts)
     """
 
-    @abstractmethod
     def complete(
         self,
         prompt: str,
         model: str,
         temperature: float = 0.7,
-        max_tokens: Optional[int] = None,
-        **kwargs: Any
+        max_tokens: int | None = None,
+        **kwargs: Any,
     ) -> str:
         """Send a prompt to the LLM and return the completion.
 
@@ -108,28 +99,37 @@ class LLMClient(Protocol):
             TimeoutError: If request times out
             LLMError: For other LLM-related errors
         """
+        ...
 
-
-class BaseLLMClient(ABC):
-    """Base class for LLM clients.
-
-    Provides common functionality and error handling.
-    """
-
-    @abstractmethod
-    def complete(
+    async def complete_many(
         self,
-        prompt: str,
+        prompts: list[str],
         model: str,
         temperature: float = 0.7,
-        max_tokens: Optional[int] = None,
-        **kwargs: Any
-    ) -> str:
-        """Send a prompt to the LLM and return the completion."""
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Send a batch of prompts and return completions in order.
+
+        Lets providers exploit server-side continuous batching and lets the
+        pipeline overlap requests instead of serializing against LLM
+        latency. Clients without a native batch endpoint can rely on
+        ``summarion.llm.batching.complete_many``, which fans out over
+        ``complete`` with bounded concurrency.
+
+        Args:
+            prompts: Prompt texts, one request each
+            model: Model identifier
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per request
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Raw text outputs, aligned with ``prompts``
+        """
         ...
 
 
-@runtime_checkable
 class Store(Protocol):
     """Protocol for storage backends.
 
@@ -138,12 +138,15 @@ class Store(Protocol):
     2. Saving results (new summaries)
     3. Appending to audit logs
     4. Namespace isolation
+
+    Validation runs at write time (``save_result`` receives an
+    already-validated model); implementations should rebuild summaries on
+    the read side via ``SummaryResult.from_trusted_dict`` (for stored
+    dicts) or ``SummaryResult.from_json_bytes`` (for raw JSON bytes of
+    external origin).
     """
 
-    @abstractmethod
-    def load_context(
-        self, namespace: str, memory_level: str = "session"
-    ) -> Optional[SummaryResult]:
+    def load_context(self, namespace: str, memory_level: str = "session") -> SummaryResult | None:
         """Load prior summary for hierarchical memory.
 
         Args:
@@ -153,8 +156,8 @@ class Store(Protocol):
         Returns:
             Prior summary or None if not found
         """
+        ...
 
-    @abstractmethod
     def save_result(
         self,
         namespace: str,
@@ -163,18 +166,43 @@ class Store(Protocol):
     ) -> None:
         """Save a summary result.
 
+        Implementations serializing to JSON should write
+        ``result.to_json_bytes()`` (pydantic-core's native serializer)
+        rather than ``json.dumps(result.model_dump())``.
+
         Args:
             namespace: Namespace identifier
             result: Summary to save
             memory_level: Memory level (rolling/session/canonical)
         """
+        ...
+
+    def save_results(
+        self,
+        namespace: str,
+        results: list[tuple[SummaryResult, str]],
+    ) -> None:
+        """Save several summary results in one batched write.
+
+        A hierarchical pipeline emitting rolling + session + canonical
+        summaries should not pay one write/fsync/PUT per level. Backends
+        should coalesce: one transaction (SQL executemany), one fsync
+        (filesystem), one multi-put (object stores). Backends without a
+        native batch path can rely on
+        ``summarion.stores.save_results``, which falls back to looping
+        ``save_result``.
+
+        Args:
+            namespace: Namespace identifier
+            results: (result, memory_level) pairs to save
+        """
+        ...
 
-    @abstractmethod
     def append_log(
         self,
         namespace: str,
         operation: str,
-        metadata: Dict[str, Any],
+        metadata: dict[str, Any],
     ) -> None:
         """Append to audit log.
 
@@ -183,38 +211,102 @@ class Store(Protocol):
             operation: Operation name (e.g., "summarize", "load_context")
             metadata: Operation metadata
         """
+        ...
+
 
+# Explicit registration replaces isinstance-based dispatch: stores register
+# under a provider name and lookups are a single dict hit.
+_STORE_REGISTRY: dict[str, Store] = {}
 
-class BaseStore(ABC):
-    """Base class for store implementations.
 
-    Provides common functionality and validation.
+def register_store(name: str, store: Store) -> None:
+    """Register a store under a provider name.
+
+    Args:
+        name: Provider name (e.g., "redis", "sqlite")
+        store: Store instance to register
     """
+    _STORE_REGISTRY[name] = store
 
-    @abstractmethod
-    def load_context(
-        self, namespace: str, memory_level: str = "session"
-    ) -> Optional[SummaryResult]:
-        """Load prior summary for hierarchical memory."""
-        ...
 
-    @abstractmethod
-    def save_result(
-        self,
-        namespace: str,
-        result: SummaryResult,
-        memory_level: str = "session",
-    ) -> None:
-        """Save a summary result."""
-        ...
+def get_store(name: str) -> Store:
+    """Look up a registered store by provider name.
 
-    @abstractmethod
-    def append_log(
-        self,
-        namespace: str,
-        operation: str,
-        metadata: Dict[str, Any],
-    ) -> None:
-        """Append to audit log."""
-        ...
+    Args:
+        name: Provider name used at registration
 
+    Raises:
+        KeyError: If no store is registered under that name
+
+    Returns:
+        The registered store
+    """
+    return _STORE_REGISTRY[name]
+
+
+# Unbound methods resolved once per (concrete type, method name). The same
+# concrete Store/LLMClient serves many requests; MRO and descriptor lookup
+# need only happen on the first call for each type.
+_METHOD_CACHE: dict[tuple[type, str], Callable[..., Any]] = {}
+
+
+def resolve(obj: Any, method_name: str) -> Callable[..., Any]:
+    """Resolve a contract method to a bound callable, cached per type.
+
+    Complements the per-instance binding the Summarizer does at
+    construction: call paths that receive stores/clients transiently (and
+    so cannot pre-bind) use this to pay the attribute lookup once per
+    concrete type instead of per call.
+
+    Args:
+        obj: Store/client/strategy instance
+        method_name: Method to resolve (e.g., "complete", "save_result")
+
+    Returns:
+        The method bound to ``obj``
+    """
+    cls = type(obj)
+    key = (cls, method_name)
+    func = _METHOD_CACHE.get(key)
+    if func is None:
+        func = getattr(cls, method_name)
+        _METHOD_CACHE[key] = func
+    return func.__get__(obj, cls)
+
+
+# Methods each protocol requires, used by conforms_to for structural checks.
+_PROTOCOL_METHODS: dict[str, tuple[str, ...]] = {
+    "ModeStrategy": ("prompt", "parse"),
+    "LLMClient": ("complete",),
+    "Store": ("load_context", "save_result", "append_log"),
+}
+
+# Conformance verdicts cached per concrete type; WeakKeyDictionary so
+# short-lived classes (e.g. test doubles) do not pin their types alive.
+_conformance_cache: "WeakKeyDictionary[type, dict[str, bool]]" = WeakKeyDictionary()
+
+
+def conforms_to(obj: Any, protocol: type) -> bool:
+    """Check structural conformance to a contract, cached per concrete type.
+
+    Replaces ``isinstance(obj, Protocol)`` (which re-probes every method on
+    every call) with a one-time reflection whose result is memoized.
+
+    Args:
+        obj: Object to check
+        protocol: One of ModeStrategy, LLMClient, Store
+
+    Returns:
+        True if the object's type provides all of the contract's methods
+    """
+    cls = type(obj)
+    per_type = _conformance_cache.get(cls)
+    if per_type is None:
+        per_type = {}
+        _conformance_cache[cls] = per_type
+    name = protocol.__name__
+    verdict = per_type.get(name)
+    if verdict is None:
+        verdict = all(callable(getattr(cls, method, None)) for method in _PROTOCOL_METHODS[name])
+        per_type[name] = verdict
+    return verdict
@@ -7,10 +7,12 @@ This module contains all data structures used throughout the framework:
 - Component models: AttributedPoint, Decision, Task, Event
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import sys
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 
 class Message(BaseModel):
@@ -23,12 +25,39 @@ class Message(BaseModel):
         timestamp: Timestamp when the message was sent (ISO format)
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str = Field(description="Unique message identifier")
     role: str = Field(description="Role of the speaker (user, assistant, system)")
     content: str = Field(description="Message text content")
-    timestamp: Optional[str] = Field(
-        default=None, description="ISO timestamp when message was sent"
-    )
+    timestamp: str | None = Field(default=None, description="ISO timestamp when message was sent")
+
+    @field_validator("role")
+    @classmethod
+    def _intern_role(cls, v: str) -> str:
+        """Intern the role string.
+
+        Roles draw from a handful of values (user/assistant/system/tool/...),
+        so interning shares one str object across a conversation instead of
+        allocating a fresh one per message. The set is left open on purpose;
+        custom roles still validate.
+        """
+        return sys.intern(v)
+
+    @classmethod
+    def from_json_bytes(cls, raw: bytes) -> "Message":
+        """Validate a message straight from raw JSON bytes.
+
+        Parses and validates in a single pass via pydantic-core's jiter,
+        avoiding the ``json.loads`` -> dict -> model double parse.
+
+        Args:
+            raw: JSON-encoded message bytes
+
+        Returns:
+            Validated message
+        """
+        return cls.model_validate_json(raw)
 
 
 class AttributedPoint(BaseModel):
@@ -39,10 +68,12 @@ class AttributedPoint(BaseModel):
         source_msg_ids: Message IDs that contributed to this point
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     text: str = Field(description="The extracted point text")
-    source_msg_ids: List[str] = Field(
-        default_factory=list,
-        description="Message IDs that contributed to this point",
+    source_msg_ids: list[str] | None = Field(
+        default=None,
+        description="Message IDs that contributed to this point (None = empty)",
     )
 
 
@@ -57,18 +88,23 @@ class Decision(BaseModel):
         source_msg_ids: Message IDs that contributed to this decision
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     decision: str = Field(description="The decision text")
     rationale: str = Field(description="Why this decision was made")
-    owner: Optional[str] = Field(default=None, description="Decision owner/responsible")
-    date: Optional[str] = Field(
-        default=None, description="ISO date when decision was made"
-    )
-    source_msg_ids: List[str] = Field(
-        default_factory=list,
-        description="Message IDs that contributed to this decision",
+    owner: str | None = Field(default=None, description="Decision owner/responsible")
+    date: str | None = Field(default=None, description="ISO date when decision was made")
+    source_msg_ids: list[str] | None = Field(
+        default=None,
+        description="Message IDs that contributed to this decision (None = empty)",
     )
 
 
+# Canonical priority levels; off-domain values degrade to None at
+# validation rather than failing the parse.
+_PRIORITY_LEVELS = frozenset({"high", "medium", "low"})
+
+
 class Task(BaseModel):
     """A task with assignee and priority.
 
@@ -80,17 +116,34 @@ class Task(BaseModel):
         source_msg_ids: Message IDs that contributed to this task
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     task: str = Field(description="The task description")
-    owner: Optional[str] = Field(default=None, description="Task owner/assignee")
-    due: Optional[str] = Field(default=None, description="Due date (ISO format)")
-    priority: Optional[str] = Field(
-        default=None, description="Priority level (high/medium/low)"
-    )
-    source_msg_ids: List[str] = Field(
-        default_factory=list,
-        description="Message IDs that contributed to this task",
+    owner: str | None = Field(default=None, description="Task owner/assignee")
+    due: str | None = Field(default=None, description="Due date (ISO format)")
+    priority: str | None = Field(default=None, description="Priority level (high/medium/low)")
+    source_msg_ids: list[str] | None = Field(
+        default=None,
+        description="Message IDs that contributed to this task (None = empty)",
     )
 
+    @field_validator("priority")
+    @classmethod
+    def _normalize_priority(cls, v: str | None) -> str | None:
+        """Normalize priority to an interned canonical level.
+
+        LLM outputs spell this all sorts of ways ("High", "URGENT", "P1");
+        a hard Literal would fail the whole parse on the first off-domain
+        value. Case-insensitive matches map to the canonical interned
+        high/medium/low, anything else degrades to None.
+        """
+        if v is None:
+            return None
+        lowered = v.strip().lower()
+        if lowered in _PRIORITY_LEVELS:
+            return sys.intern(lowered)
+        return None
+
 
 class Event(BaseModel):
     """A chronological event with timestamp.
@@ -101,11 +154,13 @@ class Event(BaseModel):
         source_msg_ids: Message IDs that contributed to this event
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     timestamp: str = Field(description="ISO timestamp when event occurred")
     event: str = Field(description="Description of the event")
-    source_msg_ids: List[str] = Field(
-        default_factory=list,
-        description="Message IDs that contributed to this event",
+    source_msg_ids: list[str] | None = Field(
+        default=None,
+        description="Message IDs that contributed to this event (None = empty)",
     )
 
 
@@ -115,6 +170,11 @@ class SummaryResult(BaseModel):
     This is the main data structure that contains all summarization results.
     Different modes populate different fields based on their purpose.
 
+    Container fields default to None rather than fresh empty containers:
+    a sparse result (most modes fill one or two fields) would otherwise
+    allocate five lists and a dict per instance. Treat None as empty when
+    reading, e.g. ``for p in result.points or ()``.
+
     Attributes:
         mode: The mode used for summarization
         title: Optional title for the summary
@@ -127,24 +187,168 @@ class SummaryResult(BaseModel):
         created_at: Timestamp when summary was created
     """
 
+    # Frozen so the cached as_mapping dump can never go stale on an
+    # instance; __copy__/__deepcopy__ drop the cached entry so copies
+    # (including model_copy(update=...)) recompute it.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     mode: str = Field(description="The mode used for summarization")
-    title: Optional[str] = Field(default=None, description="Optional title")
-    points: List[AttributedPoint] = Field(
-        default_factory=list, description="Key points"
+    title: str | None = Field(default=None, description="Optional title")
+    points: list[AttributedPoint] | None = Field(
+        default=None, description="Key points (None = empty)"
     )
-    decisions: List[Decision] = Field(default_factory=list, description="Key decisions")
-    timeline: List[Event] = Field(
-        default_factory=list, description="Chronological events"
+    decisions: list[Decision] | None = Field(
+        default=None, description="Key decisions (None = empty)"
     )
-    tasks: List[Task] = Field(default_factory=list, description="Action items/tasks")
-    summary: Optional[str] = Field(default=None, description="Freeform narrative")
-    metadata: Dict[str, Any] = Field(
-        default_factory=dict, description="Additional metadata"
+    timeline: list[Event] | None = Field(
+        default=None, description="Chronological events (None = empty)"
     )
-    created_at: Optional[str] = Field(
+    tasks: list[Task] | None = Field(default=None, description="Action items/tasks (None = empty)")
+    summary: str | None = Field(default=None, description="Freeform narrative")
+    metadata: dict[str, Any] | None = Field(
+        default=None, description="Additional metadata (None = empty)"
+    )
+    created_at: str | None = Field(
         default=None, description="ISO timestamp when summary was created"
     )
 
+    @cached_property
+    def as_mapping(self) -> Mapping[str, Any]:
+        """Plain-dict view of this summary, computed once per instance.
+
+        Audit logging and save paths tend to dump the same result several
+        times; since the model is frozen, the first ``model_dump`` can be
+        reused for the life of the instance.
+        """
+        return self.model_dump(mode="python")
+
+    def __copy__(self) -> "SummaryResult":
+        # cached_property stores as_mapping in __dict__, which copying
+        # would carry over; model_copy(update=...) goes through here, and
+        # a carried-over dump would not reflect the updated fields.
+        copied = super().__copy__()
+        copied.__dict__.pop("as_mapping", None)
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "SummaryResult":
+        copied = super().__deepcopy__(memo)
+        copied.__dict__.pop("as_mapping", None)
+        return copied
+
+    def replace(self, **overrides: Any) -> "SummaryResult":
+        """Copy this summary with some fields swapped, skipping validation.
+
+        Filter/map operations over an already-validated result
+        (e.g. ``result.replace(tasks=[t for t in result.tasks or () if
+        t.priority != "low"])``) would otherwise re-validate every field
+        through normal construction. Fields are carried over as-is via
+        ``model_construct``; only pass values that are themselves valid.
+
+        Args:
+            **overrides: Field values to replace
+
+        Returns:
+            New summary result built without validation
+        """
+        data = {name: getattr(self, name) for name in type(self).model_fields}
+        data.update(overrides)
+        return type(self).model_construct(**data)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes via pydantic-core.
+
+        The save path counterpart of ``from_json_bytes``: store
+        implementations should write these bytes instead of
+        ``json.dumps(result.model_dump())``, which round-trips through a
+        Python dict and the stdlib encoder.
+        """
+        return self.model_dump_json().encode("utf-8")
+
+    @classmethod
+    def from_json_bytes(cls, raw: bytes) -> "SummaryResult":
+        """Validate a summary result straight from raw JSON bytes.
+
+        Single-pass parse-and-validate; store implementations should prefer
+        this in ``load_context`` over ``SummaryResult(**json.loads(raw))``.
+
+        Args:
+            raw: JSON-encoded summary bytes
+
+        Returns:
+            Validated summary result
+        """
+        return cls.model_validate_json(raw)
+
+    @classmethod
+    def from_llm_output(cls, text: str, messages: list["Message"]) -> "SummaryResult":
+        """Parse and validate an LLM response in a single pass.
+
+        Replaces the hand-rolled ``json.loads(output)`` +
+        ``SummaryResult(**d)`` pattern in mode parsers (double parse,
+        double validation). Attribution is then tightened against the
+        source messages: ids that don't refer to any input message are
+        dropped, and the rest are replaced with the messages' own str
+        objects so a result shares ids with its conversation instead of
+        duplicating them.
+
+        Args:
+            text: Raw JSON text output from the LLM
+            messages: Original messages for attribution
+
+        Returns:
+            Validated summary result with cleaned attribution
+        """
+        # Local import: attribution imports these models at module scope.
+        from summarion.core.attribution import message_index, resolve_span
+
+        result = cls.model_validate_json(text)
+        index = message_index(messages)
+        for name in _SUMMARY_RESULT_NESTED_FIELDS:
+            for item in getattr(result, name) or ():
+                ids = item.source_msg_ids
+                if ids:
+                    # In-place: component models are frozen but their id
+                    # lists are not, and no caller holds them yet.
+                    ids[:] = [messages[i].id for i in resolve_span(ids, index)]
+        return result
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> "SummaryResult":
+        """Rebuild a summary from trusted data without re-validating.
+
+        Summaries loaded from a store were validated when written, so
+        re-running field validation on every ``load_context`` is pure
+        overhead. This uses ``model_construct`` throughout, rebuilding
+        nested models via the precomputed field->type map. Only use this
+        for data produced by this system; external input must go through
+        ``from_json_bytes`` / ``model_validate``.
+
+        Args:
+            data: Previously validated summary data
+
+        Returns:
+            Summary result built without validation
+        """
+        fields = dict(data)
+        for name, model_type in _SUMMARY_RESULT_NESTED_FIELDS.items():
+            items = fields.get(name)
+            if items:
+                fields[name] = [
+                    model_type.model_construct(**item) if isinstance(item, dict) else item
+                    for item in items
+                ]
+        return cls.model_construct(**fields)
+
+
+# Nested model fields of SummaryResult, precomputed once so trusted loads
+# can rebuild children without per-call reflection.
+_SUMMARY_RESULT_NESTED_FIELDS: dict[str, type] = {
+    "points": AttributedPoint,
+    "decisions": Decision,
+    "timeline": Event,
+    "tasks": Task,
+}
+
 
 class SummarizerConfig(BaseModel):
     """Configuration for the summarizer.
@@ -159,13 +363,36 @@ class SummarizerConfig(BaseModel):
         memory_level: Memory level (rolling/session/canonical)
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     namespace: str = Field(description="Namespace identifier")
     llm_provider: str = Field(default="openai", description="LLM provider")
     max_tokens: int = Field(default=4000, description="Max tokens per request")
     max_cost_usd: float = Field(default=0.05, description="Max cost in USD")
     temperature: float = Field(default=0.7, description="Sampling temperature")
-    enable_pii_redaction: bool = Field(
-        default=True, description="Enable PII redaction"
-    )
+    enable_pii_redaction: bool = Field(default=True, description="Enable PII redaction")
     memory_level: str = Field(default="session", description="Memory level")
 
+
+# Built once at import: TypeAdapter construction is expensive, and shared
+# adapters move that cost from per-request to once-per-process. The list
+# adapter validates a whole JSON array in one pass instead of constructing
+# Message per element; callers must use these globals rather than building
+# their own.
+MESSAGE_LIST_ADAPTER: TypeAdapter = TypeAdapter(list[Message])
+SUMMARY_RESULT_ADAPTER: TypeAdapter = TypeAdapter(SummaryResult)
+
+
+def parse_messages(raw: "bytes | str") -> list[Message]:
+    """Validate a JSON array of messages in one pass.
+
+    The ingress entrypoint for callers crossing the process boundary with
+    JSON message lists (HTTP payloads, JSONL batches).
+
+    Args:
+        raw: JSON-encoded array of message objects, bytes or str
+
+    Returns:
+        List of validated messages
+    """
+    return MESSAGE_LIST_ADAPTER.validate_json(raw)
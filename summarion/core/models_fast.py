@@ -0,0 +1,224 @@
+"""
+msgspec-based fast-path models for the summarization framework.
+
+These mirror the pydantic models in :mod:`summarion.core.models` but are built
+on ``msgspec.Struct``, which makes validated JSON decode and instance
+construction several times cheaper. Use these on hot paths where thousands of
+``Message`` objects are constructed per request (JSON ingress) or where
+``SummaryResult`` objects are decoded from LLM outputs and store loads.
+
+The two families share one wire shape: container fields default to None
+(treat None as empty, as documented on the pydantic models) and unknown
+keys are rejected, so a summary written by either side reads back
+identically through the other.
+
+Structs are slotted (no per-instance ``__dict__``) and frozen, so they cost
+a fraction of the memory of dict-backed models and are safe to hash and
+cache. Validation happens once at decode; attribute access afterwards is
+plain slot reads. Pydantic stays at the outermost Summarizer API boundary
+where untrusted user input arrives; internal pipeline stages should prefer
+these.
+
+Module-level ``msgspec.json.Decoder``/``Encoder`` instances are created once
+at import and reused; store implementations should feed raw bytes straight
+to ``SUMMARY_RESULT_DECODER.decode(raw_bytes)`` rather than going through an
+intermediate ``json.loads`` dict, and write ``encode_json(result)`` bytes on
+the way out.
+"""
+
+from typing import Any
+
+import msgspec
+
+
+class Message(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Represents a single message in a conversation.
+
+    Attributes:
+        id: Unique message identifier
+        role: Role of the speaker (user, assistant, system, etc.)
+        content: Message text content
+        timestamp: Timestamp when the message was sent (ISO format)
+    """
+
+    id: str
+    role: str
+    content: str
+    timestamp: str | None = None
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return a plain dict, compatible with pydantic's ``model_dump``."""
+        return msgspec.to_builtins(self)
+
+
+class AttributedPoint(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    """A key point with attribution to source messages.
+
+    Attributes:
+        text: The extracted point text
+        source_msg_ids: Message IDs that contributed to this point
+    """
+
+    text: str
+    source_msg_ids: list[str] | None = None
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return a plain dict, compatible with pydantic's ``model_dump``."""
+        return msgspec.to_builtins(self)
+
+
+class Decision(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    """A decision with context and attribution.
+
+    Attributes:
+        decision: The decision text
+        rationale: Why this decision was made
+        owner: Who owns/responsible for this decision
+        date: When the decision was made (ISO date format)
+        source_msg_ids: Message IDs that contributed to this decision
+    """
+
+    decision: str
+    rationale: str
+    owner: str | None = None
+    date: str | None = None
+    source_msg_ids: list[str] | None = None
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return a plain dict, compatible with pydantic's ``model_dump``."""
+        return msgspec.to_builtins(self)
+
+
+class Task(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    """A task with assignee and priority.
+
+    Attributes:
+        task: The task description
+        owner: Who is assigned to this task
+        due: Due date (ISO date format)
+        priority: Priority level (high, medium, low)
+        source_msg_ids: Message IDs that contributed to this task
+    """
+
+    task: str
+    owner: str | None = None
+    due: str | None = None
+    priority: str | None = None
+    source_msg_ids: list[str] | None = None
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return a plain dict, compatible with pydantic's ``model_dump``."""
+        return msgspec.to_builtins(self)
+
+
+class Event(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    """A chronological event with timestamp.
+
+    Attributes:
+        timestamp: When the event occurred (ISO timestamp)
+        event: Description of the event
+        source_msg_ids: Message IDs that contributed to this event
+    """
+
+    timestamp: str
+    event: str
+    source_msg_ids: list[str] | None = None
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return a plain dict, compatible with pydantic's ``model_dump``."""
+        return msgspec.to_builtins(self)
+
+
+class SummaryResult(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    """The output of summarization.
+
+    Fast-path counterpart of :class:`summarion.core.models.SummaryResult`.
+    Different modes populate different fields based on their purpose.
+
+    Attributes:
+        mode: The mode used for summarization
+        title: Optional title for the summary
+        points: List of key points (for pointwise mode)
+        decisions: List of key decisions (for key_decisions mode)
+        timeline: List of chronological events (for timeline mode)
+        tasks: List of action items/tasks
+        summary: Freeform narrative summary
+        metadata: Additional metadata (cost, tokens, etc.)
+        created_at: Timestamp when summary was created
+    """
+
+    mode: str
+    title: str | None = None
+    points: list[AttributedPoint] | None = None
+    decisions: list[Decision] | None = None
+    timeline: list[Event] | None = None
+    tasks: list[Task] | None = None
+    summary: str | None = None
+    metadata: dict[str, Any] | None = None
+    created_at: str | None = None
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return a plain dict, compatible with pydantic's ``model_dump``."""
+        return msgspec.to_builtins(self)
+
+
+class SummarizerConfig(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Configuration for the summarizer.
+
+    Attributes:
+        namespace: Namespace identifier for multi-tenancy
+        llm_provider: LLM provider name (e.g., 'openai', 'anthropic')
+        max_tokens: Maximum tokens per request
+        max_cost_usd: Maximum cost in USD per operation
+        temperature: Sampling temperature
+        enable_pii_redaction: Whether to enable PII redaction
+        memory_level: Memory level (rolling/session/canonical)
+    """
+
+    namespace: str
+    llm_provider: str = "openai"
+    max_tokens: int = 4000
+    max_cost_usd: float = 0.05
+    temperature: float = 0.7
+    enable_pii_redaction: bool = True
+    memory_level: str = "session"
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return a plain dict, compatible with pydantic's ``model_dump``."""
+        return msgspec.to_builtins(self)
+
+
+# Decoders/encoder are created once at import and reused: constructing a
+# msgspec.json.Decoder per call throws away its cached decode plan.
+MESSAGE_DECODER: msgspec.json.Decoder = msgspec.json.Decoder(Message)
+MESSAGE_LIST_DECODER: msgspec.json.Decoder = msgspec.json.Decoder(list[Message])
+SUMMARY_RESULT_DECODER: msgspec.json.Decoder = msgspec.json.Decoder(SummaryResult)
+_ENCODER: msgspec.json.Encoder = msgspec.json.Encoder()
+
+
+def decode_message(raw: bytes) -> Message:
+    """Decode a single message from raw JSON bytes in one validated pass."""
+    return MESSAGE_DECODER.decode(raw)
+
+
+def decode_messages(raw: bytes) -> list[Message]:
+    """Decode a JSON array of messages from raw bytes in one validated pass."""
+    return MESSAGE_LIST_DECODER.decode(raw)
+
+
+def decode_summary_result(raw: bytes) -> SummaryResult:
+    """Decode a summary result from raw JSON bytes in one validated pass.
+
+    Store implementations should call this from ``load_context`` instead of
+    round-tripping through ``json.loads`` and per-field construction.
+    """
+    return SUMMARY_RESULT_DECODER.decode(raw)
+
+
+def encode_json(obj: Any) -> bytes:
+    """Encode a fast-path model (or list of them) straight to JSON bytes.
+
+    The write-side counterpart of the decoders above; skips the
+    model -> dict -> stdlib json encoder round trip.
+    """
+    return _ENCODER.encode(obj)
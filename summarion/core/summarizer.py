@@ -0,0 +1,232 @@
+"""
+Summarizer orchestration for the summarization framework.
+
+The Summarizer wires a ModeStrategy, an LLMClient, and an optional Store
+into the summarize pipeline: prompt generation, LLM completion, output
+parsing, persistence, and audit logging. It does orchestration only;
+all real work is delegated to the injected strategy/adapters.
+"""
+
+import hashlib
+from collections import OrderedDict
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+
+from summarion.core.contracts import LLMClient, ModeStrategy, Store
+from summarion.core.models import Message, SummarizerConfig, SummaryResult
+from summarion.llm.batching import complete_many
+from summarion.stores import save_results
+
+logger = structlog.get_logger()
+
+# A relatively small cache already removes most of the repeated work in
+# rolling/session/canonical rollups, which re-summarize the same prefix.
+_MEMO_MAX_ENTRIES = 1024
+
+
+def _content_key(messages: list[Message]) -> str:
+    """Digest of a message window's full content.
+
+    Memo keys must cover content, not just ids: different conversations
+    (and different tenants) can reuse the same message ids, and keying on
+    ids alone would serve one namespace's cached prompt to another.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for m in messages:
+        h.update(m.id.encode())
+        h.update(b"\x1f")
+        h.update(m.role.encode())
+        h.update(b"\x1f")
+        h.update(m.content.encode())
+        h.update(b"\x1f")
+        if m.timestamp is not None:
+            h.update(m.timestamp.encode())
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+
+class Summarizer:
+    """Orchestrates summarization over a mode, an LLM client, and a store.
+
+    Attributes:
+        config: Summarizer configuration
+        mode: Strategy that generates prompts and parses outputs
+        client: LLM provider client
+        store: Optional persistence backend
+        model: Model identifier passed to the client
+    """
+
+    # prompt() and parse() are pure functions of their inputs, and
+    # hierarchical memory re-summarizes the same message prefix at each
+    # level. Class-level caches (LRU-evicted) let rollup passes share
+    # entries across Summarizer instances; keys include mode name and
+    # version plus a digest of the full message content (see _content_key).
+    _prompt_memo: "OrderedDict[tuple[str, str, str], str]" = OrderedDict()
+    _parse_memo: "OrderedDict[tuple[str, str, str, str], SummaryResult]" = OrderedDict()
+
+    def __init__(
+        self,
+        config: SummarizerConfig,
+        mode: ModeStrategy | str,
+        client: LLMClient,
+        store: Store | None = None,
+        model: str = "gpt-4o-mini",
+    ) -> None:
+        if isinstance(mode, str):
+            # Registry lookup: modes are validated once at registration,
+            # so resolution here is a single dict hit with no structural
+            # checks on the hot path.
+            from summarion.modes import get_mode
+
+            mode = get_mode(mode)
+        self.config = config
+        self.mode = mode
+        self.client = client
+        self.store = store
+        self.model = model
+        # Bind the hot-path callables once. summarize() runs per message
+        # batch, and resolving prompt/parse/complete through attribute
+        # lookup plus the descriptor protocol on every call is avoidable
+        # dispatch cost; a bound method is a single local load.
+        self._prompt = mode.prompt
+        self._parse = mode.parse
+        self._complete = client.complete
+
+    def load_context(self) -> SummaryResult | None:
+        """Load the prior summary for this namespace, if a store is set.
+
+        Returns:
+            Prior summary or None if no store or nothing saved
+        """
+        if self.store is None:
+            return None
+        return self.store.load_context(self.config.namespace, self.config.memory_level)
+
+    def summarize(self, messages: list[Message]) -> SummaryResult:
+        """Run the full pipeline over a batch of messages.
+
+        Args:
+            messages: Messages to summarize
+
+        Returns:
+            Structured summary result (persisted if a store is configured)
+        """
+        msg_key = _content_key(messages)
+        prompt = self._memoized_prompt(messages, msg_key)
+        output = self._complete(
+            prompt,
+            model=self.model,
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+        )
+        result = self._memoized_parse(output, messages, msg_key)
+        return self._finalize(result, messages)
+
+    async def summarize_many(self, batches: list[list[Message]]) -> list[SummaryResult]:
+        """Summarize several message batches with one batched LLM call.
+
+        Prompts for all batches are generated up front and sent through
+        ``complete_many``, so requests overlap instead of serializing
+        against provider latency.
+
+        Args:
+            batches: Message batches, one summary each
+
+        Returns:
+            Summary results, aligned with ``batches``
+        """
+        msg_keys = [_content_key(batch) for batch in batches]
+        prompts = [
+            self._memoized_prompt(batch, key) for batch, key in zip(batches, msg_keys, strict=True)
+        ]
+        outputs = await complete_many(
+            self.client,
+            prompts,
+            model=self.model,
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+        )
+        results = [
+            self._finalize(self._memoized_parse(output, batch, key), batch, persist=False)
+            for output, batch, key in zip(outputs, batches, msg_keys, strict=True)
+        ]
+        if self.store is not None:
+            # One batched write for the whole pipeline emission instead of
+            # a write/fsync/PUT per summary.
+            level = self.config.memory_level
+            save_results(
+                self.store,
+                self.config.namespace,
+                [(result, level) for result in results],
+            )
+            for result, batch in zip(results, batches, strict=True):
+                self.store.append_log(
+                    self.config.namespace,
+                    "summarize",
+                    self._log_metadata(result, batch),
+                )
+        return results
+
+    def _finalize(
+        self, result: SummaryResult, messages: list[Message], persist: bool = True
+    ) -> SummaryResult:
+        """Stamp, persist, and log a parsed summary.
+
+        With ``persist=False`` only the timestamp is applied; batch
+        callers persist afterwards through the store's batched write.
+        """
+        if result.created_at is None:
+            result = result.model_copy(update={"created_at": datetime.now(UTC).isoformat()})
+        if persist and self.store is not None:
+            self.store.save_result(self.config.namespace, result, self.config.memory_level)
+            self.store.append_log(
+                self.config.namespace,
+                "summarize",
+                self._log_metadata(result, messages),
+            )
+        logger.info(
+            "summarize_completed",
+            mode=result.mode,
+            message_count=len(messages),
+            namespace=self.config.namespace,
+        )
+        return result
+
+    def _memoized_prompt(self, messages: list[Message], msg_key: str) -> str:
+        """Generate (or reuse) the prompt for a batch of messages."""
+        key = (self.mode.mode_name, self.mode.mode_version, msg_key)
+        memo = Summarizer._prompt_memo
+        hit = memo.get(key)
+        if hit is not None:
+            memo.move_to_end(key)
+            return hit
+        prompt = self._prompt(messages)
+        memo[key] = prompt
+        if len(memo) > _MEMO_MAX_ENTRIES:
+            memo.popitem(last=False)
+        return prompt
+
+    def _memoized_parse(self, output: str, messages: list[Message], msg_key: str) -> SummaryResult:
+        """Parse (or reuse) the structured summary for an LLM output."""
+        key = (self.mode.mode_name, self.mode.mode_version, output, msg_key)
+        memo = Summarizer._parse_memo
+        hit = memo.get(key)
+        if hit is not None:
+            memo.move_to_end(key)
+            return hit
+        result = self._parse(output, messages)
+        memo[key] = result
+        if len(memo) > _MEMO_MAX_ENTRIES:
+            memo.popitem(last=False)
+        return result
+
+    def _log_metadata(self, result: SummaryResult, messages: list[Message]) -> dict[str, Any]:
+        """Build audit-log metadata for a completed summarize call."""
+        return {
+            "mode": result.mode,
+            "model": self.model,
+            "message_count": len(messages),
+            "memory_level": self.config.memory_level,
+        }
@@ -0,0 +1,72 @@
+"""
+Batched completion helpers for LLM clients.
+
+Summarizing many windows or namespaces one `complete` call at a time
+serializes the pipeline against provider latency. `complete_many` here is
+the shared batch entrypoint: clients with a native batch endpoint are used
+directly, and everything else is fanned out concurrently over the
+single-prompt `complete` with a semaphore bounding in-flight requests.
+"""
+
+import asyncio
+from typing import Any
+
+from summarion.core.contracts import LLMClient
+
+# Default cap on in-flight requests for clients without native batching;
+# high enough to overlap latency, low enough to stay under provider
+# rate limits.
+DEFAULT_CONCURRENCY_LIMIT = 8
+
+
+async def complete_many(
+    client: LLMClient,
+    prompts: list[str],
+    model: str,
+    temperature: float = 0.7,
+    max_tokens: int | None = None,
+    concurrency_limit: int = DEFAULT_CONCURRENCY_LIMIT,
+    **kwargs: Any,
+) -> list[str]:
+    """Complete a batch of prompts, preserving order.
+
+    Uses the client's native ``complete_many`` when it has one; otherwise
+    gathers ``complete`` calls in worker threads behind a semaphore so a
+    large batch cannot stampede the provider.
+
+    Args:
+        client: LLM client to call
+        prompts: Prompt texts, one request each
+        model: Model identifier
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate per request
+        concurrency_limit: Max in-flight requests for the fallback path
+        **kwargs: Additional provider-specific parameters
+
+    Returns:
+        Raw text outputs, aligned with ``prompts``
+    """
+    native = getattr(client, "complete_many", None)
+    if native is not None:
+        return await native(
+            prompts,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+
+    semaphore = asyncio.Semaphore(concurrency_limit)
+
+    async def _one(prompt: str) -> str:
+        async with semaphore:
+            return await asyncio.to_thread(
+                client.complete,
+                prompt,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+
+    return list(await asyncio.gather(*(_one(p) for p in prompts)))
@@ -0,0 +1,51 @@
+"""
+Summarization mode strategies.
+
+Modes register here under their ``mode_name`` and are resolved by a single
+dict lookup. Structural validation happens once at registration (via the
+per-type cached ``conforms_to``), so the summarize hot path never pays for
+runtime protocol checks.
+"""
+
+from summarion.core.contracts import ModeStrategy, conforms_to
+
+_MODE_REGISTRY: dict[str, ModeStrategy] = {}
+
+
+def register_mode(strategy: ModeStrategy) -> None:
+    """Register a mode strategy under its mode_name.
+
+    The strategy is checked against the ModeStrategy contract here, once,
+    so lookups and calls never re-probe it.
+
+    Args:
+        strategy: Mode strategy instance to register
+
+    Raises:
+        TypeError: If the strategy does not implement ModeStrategy
+    """
+    if not conforms_to(strategy, ModeStrategy):
+        raise TypeError(f"{type(strategy).__name__} does not implement the ModeStrategy contract")
+    _MODE_REGISTRY[strategy.mode_name] = strategy
+
+
+def get_mode(name: str) -> ModeStrategy:
+    """Look up a registered mode strategy by name.
+
+    Args:
+        name: Mode name used at registration (e.g., "pointwise")
+
+    Raises:
+        KeyError: If no mode is registered under that name
+
+    Returns:
+        The registered strategy
+    """
+    try:
+        return _MODE_REGISTRY[name]
+    except KeyError:
+        raise KeyError(f"no mode registered under {name!r}") from None
+
+
+# Built-in modes register themselves on import.
+from summarion.modes import pointwise  # noqa: E402, F401
@@ -0,0 +1,55 @@
+"""
+Pointwise summarization mode.
+
+Extracts key points with attribution from a conversation. The LLM is asked
+for JSON matching the SummaryResult schema, and ``parse`` decodes the
+response in a single validated pass via the mode's ``output_schema``.
+"""
+
+from summarion.core.models import Message, SummaryResult
+from summarion.modes import register_mode
+
+_PROMPT_HEADER = (
+    "Summarize the following conversation into key points.\n"
+    "Respond with only a JSON object of the form:\n"
+    '{"mode": "pointwise", "title": "...", '
+    '"points": [{"text": "...", "source_msg_ids": ["..."]}]}\n'
+    "Each point must cite the ids of the messages it came from.\n"
+    "\n"
+    "Conversation:\n"
+)
+
+
+class PointwiseStrategy:
+    """Mode strategy that extracts attributed key points."""
+
+    mode_name = "pointwise"
+    mode_version = "1"
+    output_schema = SummaryResult
+
+    def prompt(self, messages: list[Message]) -> str:
+        """Generate the pointwise extraction prompt.
+
+        Args:
+            messages: List of messages to summarize
+
+        Returns:
+            Prompt string to send to LLM
+        """
+        lines = [f"[{m.id}] {m.role}: {m.content}" for m in messages]
+        return _PROMPT_HEADER + "\n".join(lines)
+
+    def parse(self, output: str, messages: list[Message]) -> SummaryResult:
+        """Parse the LLM's JSON response into a summary.
+
+        Args:
+            output: Raw text output from LLM
+            messages: Original messages for attribution
+
+        Returns:
+            Structured summary result
+        """
+        return self.output_schema.from_llm_output(output, messages)
+
+
+register_mode(PointwiseStrategy())
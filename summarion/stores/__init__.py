@@ -0,0 +1,35 @@
+"""
+Persistence backends for the summarization framework.
+
+Concrete stores implement the Store protocol and register themselves via
+``summarion.core.contracts.register_store``. ``save_results`` here is the
+shared batched write entrypoint: backends with a native multi-write (one
+transaction, one fsync, one multi-put) are used directly, and everything
+else falls back to looping ``save_result``.
+"""
+
+from summarion.core.contracts import Store
+from summarion.core.models import SummaryResult
+
+
+def save_results(
+    store: Store,
+    namespace: str,
+    results: list[tuple[SummaryResult, str]],
+) -> None:
+    """Save a batch of summary results, coalescing I/O where possible.
+
+    Uses the store's native ``save_results`` when it has one; otherwise
+    loops ``save_result`` per (result, memory_level) pair.
+
+    Args:
+        store: Store to write to
+        namespace: Namespace identifier
+        results: (result, memory_level) pairs to save
+    """
+    native = getattr(store, "save_results", None)
+    if native is not None:
+        native(namespace, results)
+        return
+    for result, memory_level in results:
+        store.save_result(namespace, result, memory_level)
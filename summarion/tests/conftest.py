@@ -0,0 +1,106 @@
+"""
+Shared fixtures and test doubles for the test suite.
+"""
+
+import pytest
+
+from summarion.core.models import Message, SummaryResult
+from summarion.core.summarizer import Summarizer
+
+# A well-formed pointwise response referencing the sample messages.
+CANNED_OUTPUT = (
+    '{"mode": "pointwise", "title": "Standup",'
+    ' "points": [{"text": "Ship v2 on Friday.", "source_msg_ids": ["m1", "m2"]}]}'
+)
+
+
+class FakeClient:
+    """LLMClient double that records prompts and returns a canned output."""
+
+    def __init__(self, output: str = CANNED_OUTPUT) -> None:
+        self.output = output
+        self.prompts: list[str] = []
+
+    def complete(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        **kwargs: object,
+    ) -> str:
+        self.prompts.append(prompt)
+        return self.output
+
+
+class CountingMode:
+    """ModeStrategy double that counts prompt/parse invocations."""
+
+    mode_name = "counting"
+    mode_version = "1"
+    output_schema = SummaryResult
+
+    def __init__(self) -> None:
+        self.prompt_calls = 0
+        self.parse_calls = 0
+
+    def prompt(self, messages: list[Message]) -> str:
+        self.prompt_calls += 1
+        return "PROMPT|" + "|".join(f"{m.id}:{m.content}" for m in messages)
+
+    def parse(self, output: str, messages: list[Message]) -> SummaryResult:
+        self.parse_calls += 1
+        return SummaryResult.from_llm_output(output, messages)
+
+
+class InMemoryStore:
+    """Store double without a native batch path (exercises fallbacks)."""
+
+    def __init__(self) -> None:
+        self.saved: dict[tuple[str, str], SummaryResult] = {}
+        self.save_calls = 0
+        self.logs: list[tuple[str, str, dict]] = []
+
+    def load_context(self, namespace: str, memory_level: str = "session") -> SummaryResult | None:
+        return self.saved.get((namespace, memory_level))
+
+    def save_result(
+        self,
+        namespace: str,
+        result: SummaryResult,
+        memory_level: str = "session",
+    ) -> None:
+        self.save_calls += 1
+        self.saved[(namespace, memory_level)] = result
+
+    def append_log(self, namespace: str, operation: str, metadata: dict) -> None:
+        self.logs.append((namespace, operation, metadata))
+
+
+@pytest.fixture
+def sample_messages() -> list[Message]:
+    return [
+        Message(id="m1", role="user", content="We should ship v2 on Friday."),
+        Message(id="m2", role="assistant", content="Agreed; QA signs off Thursday."),
+        Message(id="m3", role="user", content="Release notes are high priority."),
+    ]
+
+
+@pytest.fixture
+def fake_client() -> FakeClient:
+    return FakeClient()
+
+
+@pytest.fixture
+def memory_store() -> InMemoryStore:
+    return InMemoryStore()
+
+
+@pytest.fixture(autouse=True)
+def clear_summarizer_memos():
+    """Keep the class-level prompt/parse memos isolated between tests."""
+    Summarizer._prompt_memo.clear()
+    Summarizer._parse_memo.clear()
+    yield
+    Summarizer._prompt_memo.clear()
+    Summarizer._parse_memo.clear()
@@ -0,0 +1,73 @@
+"""
+Unit tests for packed attribution tables and window id resolution.
+"""
+
+from array import array
+
+from summarion.core.attribution import AttributionTable, message_index, resolve_span
+from summarion.core.models import AttributedPoint, SummaryResult, Task
+
+
+def _result() -> SummaryResult:
+    return SummaryResult(
+        mode="pointwise",
+        points=[
+            AttributedPoint(text="a", source_msg_ids=["m1", "m2"]),
+            AttributedPoint(text="b", source_msg_ids=["m2"]),
+        ],
+        tasks=[Task(task="t", source_msg_ids=["m3", "m1"])],
+    )
+
+
+class TestAttributionTable:
+    def test_id_table_is_deduplicated_in_first_seen_order(self):
+        table = AttributionTable.from_result(_result())
+        assert table.id_table == ["m1", "m2", "m3"]
+
+    def test_ids_for_round_trips_component_spans(self):
+        table = AttributionTable.from_result(_result())
+        assert table.ids_for("points", 0) == ["m1", "m2"]
+        assert table.ids_for("points", 1) == ["m2"]
+        assert table.ids_for("tasks", 0) == ["m3", "m1"]
+
+    def test_indices_for_returns_packed_array(self):
+        table = AttributionTable.from_result(_result())
+        span = table.indices_for("points", 1)
+        assert isinstance(span, array)
+        assert span.typecode == "I"
+        assert list(span) == [1]
+
+    def test_iter_spans_covers_all_components(self):
+        table = AttributionTable.from_result(_result())
+        spans = list(table.iter_spans())
+        assert [(field, position) for field, position, _ in spans] == [
+            ("points", 0),
+            ("points", 1),
+            ("tasks", 0),
+        ]
+
+    def test_referenced_ids(self):
+        assert AttributionTable.from_result(_result()).referenced_ids() == {"m1", "m2", "m3"}
+
+    def test_sparse_result_packs_empty(self):
+        table = AttributionTable.from_result(SummaryResult(mode="pointwise"))
+        assert table.id_table == []
+        assert list(table.iter_spans()) == []
+
+
+class TestWindowResolution:
+    def test_message_index_maps_ids_to_positions(self, sample_messages):
+        index = message_index(sample_messages)
+        assert index == {"m1": 0, "m2": 1, "m3": 2}
+
+    def test_resolve_span_preserves_order(self, sample_messages):
+        index = message_index(sample_messages)
+        assert list(resolve_span(["m3", "m1"], index)) == [2, 0]
+
+    def test_resolve_span_drops_unknown_ids(self, sample_messages):
+        index = message_index(sample_messages)
+        assert list(resolve_span(["ghost", "m2", "other"], index)) == [1]
+
+    def test_empty_window(self):
+        assert message_index([]) == {}
+        assert list(resolve_span(["m1"], {})) == []
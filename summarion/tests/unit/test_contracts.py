@@ -0,0 +1,67 @@
+"""
+Unit tests for the contract registries, cached conformance checks, and
+per-type method resolution.
+"""
+
+import pytest
+
+from summarion.core import contracts
+from summarion.core.contracts import (
+    LLMClient,
+    ModeStrategy,
+    Store,
+    conforms_to,
+    get_store,
+    register_store,
+    resolve,
+)
+from summarion.tests.conftest import CountingMode, InMemoryStore
+
+
+class TestStoreRegistry:
+    def test_register_and_get(self, memory_store):
+        register_store("memory-test", memory_store)
+        try:
+            assert get_store("memory-test") is memory_store
+        finally:
+            contracts._STORE_REGISTRY.pop("memory-test", None)
+
+    def test_unknown_store_raises_key_error(self):
+        with pytest.raises(KeyError):
+            get_store("nope")
+
+
+class TestConformsTo:
+    def test_conforming_doubles(self, memory_store, fake_client):
+        assert conforms_to(CountingMode(), ModeStrategy)
+        assert conforms_to(fake_client, LLMClient)
+        assert conforms_to(memory_store, Store)
+
+    def test_non_conforming_object(self):
+        assert not conforms_to(object(), ModeStrategy)
+
+    def test_verdict_is_cached_per_type(self):
+        class Probe:
+            def prompt(self, messages):
+                return ""
+
+            def parse(self, output, messages):
+                raise NotImplementedError
+
+        assert conforms_to(Probe(), ModeStrategy)
+        # The cached verdict survives later mutation of the type; the
+        # check is one-time reflection, not a live probe.
+        del Probe.parse
+        assert conforms_to(Probe(), ModeStrategy)
+
+
+class TestResolve:
+    def test_returns_bound_method(self, fake_client):
+        complete = resolve(fake_client, "complete")
+        assert complete("p", model="m") == fake_client.output
+        assert fake_client.prompts == ["p"]
+
+    def test_unbound_lookup_is_cached_per_type(self, memory_store):
+        resolve(memory_store, "append_log")
+        key = (InMemoryStore, "append_log")
+        assert contracts._METHOD_CACHE[key] is InMemoryStore.append_log
@@ -0,0 +1,166 @@
+"""
+Unit tests for LLM client adapters: the batched completion helper and the
+aiohttp-backed HTTP client (against a local in-process endpoint).
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from summarion.llm.batching import complete_many
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from summarion.llm.http_client import HTTPLLMClient  # noqa: E402
+
+
+class EchoClient:
+    """Sync-only client; exercises the threaded fallback in complete_many."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def complete(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        **kwargs: object,
+    ) -> str:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return f"{model}:{prompt}"
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class NativeBatchClient:
+    """Client with a native batch endpoint; the fallback must not be used."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def complete(self, prompt: str, model: str, **kwargs: object) -> str:
+        raise AssertionError("fallback path used despite native complete_many")
+
+    async def complete_many(
+        self,
+        prompts: list[str],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        **kwargs: object,
+    ) -> list[str]:
+        self.batches.append(list(prompts))
+        return [p.upper() for p in prompts]
+
+
+class TestCompleteMany:
+    async def test_fallback_preserves_prompt_order(self):
+        outputs = await complete_many(EchoClient(), ["a", "b", "c"], model="m")
+        assert outputs == ["m:a", "m:b", "m:c"]
+
+    async def test_fallback_bounds_concurrency(self):
+        client = EchoClient()
+        await complete_many(client, [f"p{i}" for i in range(16)], model="m", concurrency_limit=2)
+        assert client.max_in_flight <= 2
+
+    async def test_native_batch_endpoint_is_preferred(self):
+        client = NativeBatchClient()
+        outputs = await complete_many(client, ["a", "b"], model="m")
+        assert outputs == ["A", "B"]
+        assert client.batches == [["a", "b"]]
+
+    async def test_empty_batch(self):
+        assert await complete_many(EchoClient(), [], model="m") == []
+
+
+@pytest.fixture
+def local_llm_server():
+    """OpenAI-compatible /chat/completions endpoint in a side thread.
+
+    The client's sync ``complete`` runs its own ``asyncio.run``, so the
+    server cannot share the test's event loop.
+    """
+    requests: list[dict] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        payload = await request.json()
+        requests.append({"payload": payload, "authorization": request.headers.get("Authorization")})
+        content = "echo:" + payload["messages"][0]["content"]
+        return web.json_response({"choices": [{"message": {"content": content}}]})
+
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    state: dict[str, int] = {}
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", handler)
+        runner = web.AppRunner(app)
+
+        async def start() -> None:
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            state["port"] = runner.addresses[0][1]
+
+        loop.run_until_complete(start())
+        started.set()
+        loop.run_forever()
+        loop.run_until_complete(runner.cleanup())
+        loop.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert started.wait(5)
+    yield SimpleNamespace(url=f"http://127.0.0.1:{state['port']}/v1", requests=requests)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+
+
+class TestHTTPLLMClient:
+    def test_sync_complete_is_repeatable(self, local_llm_server):
+        # Each asyncio.run creates and closes its own loop; the client must
+        # not reuse a session bound to a dead loop on the second call.
+        client = HTTPLLMClient(local_llm_server.url)
+        assert client.complete("one", model="m") == "echo:one"
+        assert client.complete("two", model="m") == "echo:two"
+        assert client._session is None or client._session.closed
+
+    def test_request_payload_and_auth_header(self, local_llm_server):
+        client = HTTPLLMClient(local_llm_server.url, api_key="sk-test")
+        client.complete("p", model="gpt-x", temperature=0.2, max_tokens=64)
+        request = local_llm_server.requests[-1]
+        assert request["authorization"] == "Bearer sk-test"
+        assert request["payload"]["model"] == "gpt-x"
+        assert request["payload"]["temperature"] == 0.2
+        assert request["payload"]["max_tokens"] == 64
+
+    async def test_complete_many_aligned_with_prompts(self, local_llm_server):
+        client = HTTPLLMClient(local_llm_server.url, concurrency_limit=4)
+        try:
+            outputs = await client.complete_many([f"p{i}" for i in range(8)], model="m")
+            assert outputs == [f"echo:p{i}" for i in range(8)]
+        finally:
+            await client.close()
+
+    async def test_session_is_reused_within_one_loop(self, local_llm_server):
+        client = HTTPLLMClient(local_llm_server.url)
+        try:
+            await client.acomplete("a", model="m")
+            session = client._session
+            await client.acomplete("b", model="m")
+            assert client._session is session
+        finally:
+            await client.close()
@@ -0,0 +1,184 @@
+"""
+Unit tests for the pydantic models and their ingress/egress helpers.
+"""
+
+import copy
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+from summarion.core.models import (
+    AttributedPoint,
+    Message,
+    SummaryResult,
+    Task,
+    parse_messages,
+)
+
+
+class TestMessage:
+    def test_from_json_bytes_round_trip(self):
+        raw = b'{"id": "m1", "role": "user", "content": "hello"}'
+        msg = Message.from_json_bytes(raw)
+        assert msg.id == "m1"
+        assert msg.role == "user"
+        assert msg.content == "hello"
+        assert msg.timestamp is None
+
+    def test_from_json_bytes_rejects_malformed_json(self):
+        with pytest.raises(ValidationError):
+            Message.from_json_bytes(b'{"id": "m1", "role":')
+
+    def test_role_is_interned(self):
+        a = Message(id="m1", role="".join(["us", "er"]), content="x")
+        b = Message(id="m2", role="".join(["u", "ser"]), content="y")
+        assert a.role is b.role
+        assert a.role is sys.intern("user")
+
+    def test_frozen_and_extra_forbidden(self):
+        msg = Message(id="m1", role="user", content="x")
+        with pytest.raises(ValidationError):
+            msg.content = "changed"
+        with pytest.raises(ValidationError):
+            Message(id="m1", role="user", content="x", bogus=1)
+
+
+class TestParseMessages:
+    def test_parses_json_array_in_one_pass(self):
+        raw = b'[{"id": "m1", "role": "user", "content": "a"}, {"id": "m2", "role": "assistant", "content": "b"}]'
+        messages = parse_messages(raw)
+        assert [m.id for m in messages] == ["m1", "m2"]
+        assert all(isinstance(m, Message) for m in messages)
+
+    def test_accepts_str_input(self):
+        assert parse_messages("[]") == []
+
+    def test_rejects_invalid_element(self):
+        with pytest.raises(ValidationError):
+            parse_messages(b'[{"id": "m1"}]')
+
+
+class TestTaskPriority:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("high", "high"),
+            ("High", "high"),
+            ("  MEDIUM ", "medium"),
+            ("low", "low"),
+            ("urgent", None),
+            ("P1", None),
+            (None, None),
+        ],
+    )
+    def test_normalization(self, raw, expected):
+        assert Task(task="t", priority=raw).priority == expected
+
+    def test_canonical_value_is_interned(self):
+        task = Task(task="t", priority="HIGH")
+        assert task.priority is sys.intern("high")
+
+    def test_off_domain_value_does_not_abort_parse(self):
+        raw = b'{"mode": "pointwise", "tasks": [{"task": "t", "priority": "P1"}]}'
+        result = SummaryResult.from_json_bytes(raw)
+        assert result.tasks[0].priority is None
+
+
+class TestSummaryResult:
+    def test_container_fields_default_to_none(self):
+        result = SummaryResult(mode="pointwise")
+        assert result.points is None
+        assert result.decisions is None
+        assert result.timeline is None
+        assert result.tasks is None
+        assert result.metadata is None
+
+    def test_json_bytes_round_trip(self):
+        result = SummaryResult(
+            mode="pointwise",
+            title="T",
+            points=[AttributedPoint(text="p", source_msg_ids=["m1"])],
+        )
+        assert SummaryResult.from_json_bytes(result.to_json_bytes()) == result
+
+    def test_as_mapping_is_cached_per_instance(self):
+        result = SummaryResult(mode="pointwise", title="T")
+        first = result.as_mapping
+        assert first["title"] == "T"
+        assert result.as_mapping is first
+
+    def test_model_copy_invalidates_as_mapping(self):
+        result = SummaryResult(mode="pointwise", title="old")
+        assert result.as_mapping["title"] == "old"
+        updated = result.model_copy(update={"title": "new"})
+        assert updated.as_mapping["title"] == "new"
+
+    def test_deepcopy_invalidates_as_mapping(self):
+        result = SummaryResult(mode="pointwise", title="T")
+        _ = result.as_mapping
+        copied = copy.deepcopy(result)
+        assert "as_mapping" not in copied.__dict__
+
+    def test_replace_swaps_fields_without_validation(self):
+        result = SummaryResult(
+            mode="pointwise",
+            tasks=[Task(task="keep", priority="high"), Task(task="drop", priority="low")],
+        )
+        filtered = result.replace(tasks=[t for t in result.tasks if t.priority != "low"])
+        assert [t.task for t in filtered.tasks] == ["keep"]
+        assert filtered.mode == "pointwise"
+        # as_mapping is not carried into the replaced instance.
+        _ = result.as_mapping
+        replaced = result.replace(title="new")
+        assert replaced.as_mapping["title"] == "new"
+
+    def test_from_trusted_dict_rebuilds_nested_models(self):
+        data = {
+            "mode": "pointwise",
+            "points": [{"text": "p", "source_msg_ids": ["m1"]}],
+            "tasks": [{"task": "t", "priority": "high"}],
+        }
+        result = SummaryResult.from_trusted_dict(data)
+        assert isinstance(result.points[0], AttributedPoint)
+        assert isinstance(result.tasks[0], Task)
+        assert result.points[0].source_msg_ids == ["m1"]
+
+    def test_frozen_and_extra_forbidden(self):
+        result = SummaryResult(mode="pointwise")
+        with pytest.raises(ValidationError):
+            result.mode = "other"
+        with pytest.raises(ValidationError):
+            SummaryResult(mode="pointwise", bogus=1)
+
+
+class TestFromLLMOutput:
+    def test_happy_path(self, sample_messages):
+        raw = (
+            '{"mode": "pointwise", "title": "T",'
+            ' "points": [{"text": "p", "source_msg_ids": ["m1", "m3"]}]}'
+        )
+        result = SummaryResult.from_llm_output(raw, sample_messages)
+        assert result.points[0].source_msg_ids == ["m1", "m3"]
+
+    def test_hallucinated_ids_are_dropped(self, sample_messages):
+        raw = (
+            '{"mode": "pointwise",'
+            ' "points": [{"text": "p", "source_msg_ids": ["m1", "ghost", "m2"]}]}'
+        )
+        result = SummaryResult.from_llm_output(raw, sample_messages)
+        assert result.points[0].source_msg_ids == ["m1", "m2"]
+
+    def test_resolved_ids_share_message_str_objects(self, sample_messages):
+        raw = '{"mode": "pointwise", "points": [{"text": "p", "source_msg_ids": ["m2"]}]}'
+        result = SummaryResult.from_llm_output(raw, sample_messages)
+        assert result.points[0].source_msg_ids[0] is sample_messages[1].id
+
+    def test_malformed_output_raises(self, sample_messages):
+        with pytest.raises(ValidationError):
+            SummaryResult.from_llm_output("Sure! Here is the summary:", sample_messages)
+
+    def test_empty_conversation(self):
+        raw = '{"mode": "pointwise", "points": [{"text": "p", "source_msg_ids": ["m1"]}]}'
+        result = SummaryResult.from_llm_output(raw, [])
+        assert result.points[0].source_msg_ids == []
@@ -0,0 +1,84 @@
+"""
+Unit tests for the msgspec fast-path models and their wire parity with
+the pydantic family.
+"""
+
+import msgspec
+import pytest
+
+from summarion.core import models, models_fast
+from summarion.core.models_fast import (
+    decode_message,
+    decode_messages,
+    decode_summary_result,
+    encode_json,
+)
+
+
+class TestDecoders:
+    def test_decode_message(self):
+        msg = decode_message(b'{"id": "m1", "role": "user", "content": "hello"}')
+        assert msg.id == "m1"
+        assert msg.timestamp is None
+
+    def test_decode_messages_list(self):
+        raw = b'[{"id": "m1", "role": "user", "content": "a"}, {"id": "m2", "role": "assistant", "content": "b"}]'
+        messages = decode_messages(raw)
+        assert [m.id for m in messages] == ["m1", "m2"]
+
+    def test_decode_summary_result(self):
+        raw = b'{"mode": "pointwise", "points": [{"text": "p", "source_msg_ids": ["m1"]}]}'
+        result = decode_summary_result(raw)
+        assert result.points[0].source_msg_ids == ["m1"]
+
+    def test_decode_rejects_malformed_json(self):
+        with pytest.raises(msgspec.DecodeError):
+            decode_summary_result(b'{"mode":')
+
+    def test_unknown_fields_rejected(self):
+        with pytest.raises(msgspec.ValidationError):
+            decode_message(b'{"id": "m1", "role": "user", "content": "x", "bogus": 1}')
+
+
+class TestStructSemantics:
+    def test_structs_are_frozen(self):
+        msg = models_fast.Message(id="m1", role="user", content="x")
+        with pytest.raises(AttributeError):
+            msg.content = "changed"
+
+    def test_container_fields_default_to_none(self):
+        result = models_fast.SummaryResult(mode="pointwise")
+        assert result.points is None
+        assert result.metadata is None
+
+    def test_model_dump_matches_pydantic(self):
+        kwargs = {"id": "m1", "role": "user", "content": "x", "timestamp": "2026-01-01"}
+        assert models_fast.Message(**kwargs).model_dump() == models.Message(**kwargs).model_dump()
+
+
+class TestWireParity:
+    def test_pydantic_output_reads_back_through_msgspec(self):
+        result = models.SummaryResult(
+            mode="pointwise",
+            title="T",
+            points=[models.AttributedPoint(text="p", source_msg_ids=["m1"])],
+            tasks=[models.Task(task="t", priority="high")],
+        )
+        fast = decode_summary_result(result.to_json_bytes())
+        assert fast.model_dump() == result.model_dump()
+
+    def test_msgspec_output_reads_back_through_pydantic(self):
+        fast = models_fast.SummaryResult(
+            mode="pointwise",
+            decisions=[models_fast.Decision(decision="d", rationale="r")],
+        )
+        result = models.SummaryResult.from_json_bytes(encode_json(fast))
+        assert result.decisions[0].decision == "d"
+        assert result.points is None
+
+    def test_both_families_reject_unknown_keys(self):
+        raw = b'{"mode": "pointwise", "bogus": 1}'
+        with pytest.raises(msgspec.ValidationError):
+            decode_summary_result(raw)
+        with pytest.raises(ValueError):
+            models.SummaryResult.from_json_bytes(raw)
@@ -0,0 +1,56 @@
+"""
+Unit tests for the mode registry and the built-in pointwise mode.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from summarion.modes import _MODE_REGISTRY, get_mode, register_mode
+from summarion.modes.pointwise import _PROMPT_HEADER, PointwiseStrategy
+
+
+class TestModeRegistry:
+    def test_pointwise_registers_on_import(self):
+        assert isinstance(get_mode("pointwise"), PointwiseStrategy)
+
+    def test_unknown_mode_raises_key_error(self):
+        with pytest.raises(KeyError, match="no mode registered"):
+            get_mode("nope")
+
+    def test_register_mode_validates_the_contract(self):
+        class NotAMode:
+            mode_name = "broken"
+            mode_version = "1"
+
+        with pytest.raises(TypeError, match="ModeStrategy"):
+            register_mode(NotAMode())
+        assert "broken" not in _MODE_REGISTRY
+
+
+class TestPointwiseStrategy:
+    def test_prompt_cites_message_ids_and_roles(self, sample_messages):
+        prompt = PointwiseStrategy().prompt(sample_messages)
+        assert prompt.startswith(_PROMPT_HEADER)
+        for m in sample_messages:
+            assert f"[{m.id}] {m.role}: {m.content}" in prompt
+
+    def test_prompt_on_empty_conversation(self):
+        assert PointwiseStrategy().prompt([]) == _PROMPT_HEADER
+
+    def test_parse_happy_path(self, sample_messages):
+        raw = (
+            '{"mode": "pointwise", "title": "T",'
+            ' "points": [{"text": "p", "source_msg_ids": ["m1"]}]}'
+        )
+        result = PointwiseStrategy().parse(raw, sample_messages)
+        assert result.mode == "pointwise"
+        assert result.points[0].source_msg_ids == ["m1"]
+
+    def test_parse_drops_hallucinated_attribution(self, sample_messages):
+        raw = '{"mode": "pointwise", "points": [{"text": "p", "source_msg_ids": ["ghost"]}]}'
+        result = PointwiseStrategy().parse(raw, sample_messages)
+        assert result.points[0].source_msg_ids == []
+
+    def test_parse_rejects_malformed_output(self, sample_messages):
+        with pytest.raises(ValidationError):
+            PointwiseStrategy().parse("not json at all", sample_messages)
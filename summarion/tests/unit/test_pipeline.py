@@ -0,0 +1,125 @@
+"""
+Unit tests for the Summarizer pipeline: orchestration, memoization,
+persistence, and the batched path.
+"""
+
+import pytest
+
+from summarion.core.models import Message, SummarizerConfig
+from summarion.core.summarizer import Summarizer
+from summarion.modes.pointwise import PointwiseStrategy
+from summarion.tests.conftest import CountingMode, FakeClient, InMemoryStore
+
+
+@pytest.fixture
+def config() -> SummarizerConfig:
+    return SummarizerConfig(namespace="tenant-a", memory_level="session")
+
+
+class TestSummarize:
+    def test_happy_path_persists_and_logs(self, config, sample_messages, memory_store):
+        client = FakeClient()
+        summarizer = Summarizer(config, CountingMode(), client, store=memory_store)
+        result = summarizer.summarize(sample_messages)
+
+        assert result.mode == "pointwise"
+        assert result.points[0].source_msg_ids == ["m1", "m2"]
+        assert result.created_at is not None
+        assert memory_store.saved[("tenant-a", "session")] is result
+        assert memory_store.logs == [
+            (
+                "tenant-a",
+                "summarize",
+                {
+                    "mode": "pointwise",
+                    "model": summarizer.model,
+                    "message_count": 3,
+                    "memory_level": "session",
+                },
+            )
+        ]
+        # The stamped copy must not carry a pre-stamp cached dump.
+        assert result.as_mapping["created_at"] == result.created_at
+
+    def test_existing_created_at_is_preserved(self, config, sample_messages):
+        client = FakeClient(output='{"mode": "pointwise", "created_at": "2026-01-01T00:00:00"}')
+        result = Summarizer(config, CountingMode(), client).summarize(sample_messages)
+        assert result.created_at == "2026-01-01T00:00:00"
+
+    def test_works_without_a_store(self, config, sample_messages):
+        result = Summarizer(config, CountingMode(), FakeClient()).summarize(sample_messages)
+        assert result.mode == "pointwise"
+
+    def test_empty_conversation(self, config):
+        result = Summarizer(config, CountingMode(), FakeClient()).summarize([])
+        assert result.points[0].source_msg_ids == []
+
+    def test_mode_resolved_by_name_through_registry(self, config):
+        summarizer = Summarizer(config, "pointwise", FakeClient())
+        assert isinstance(summarizer.mode, PointwiseStrategy)
+
+    def test_unknown_mode_name_raises(self, config):
+        with pytest.raises(KeyError):
+            Summarizer(config, "nope", FakeClient())
+
+
+class TestMemoization:
+    def test_prompt_and_parse_memoized_for_identical_content(self, config, sample_messages):
+        mode = CountingMode()
+        client = FakeClient()
+        summarizer = Summarizer(config, mode, client)
+        first = summarizer.summarize(sample_messages)
+        second = summarizer.summarize(sample_messages)
+
+        assert mode.prompt_calls == 1
+        assert mode.parse_calls == 1
+        assert len(client.prompts) == 2  # the LLM is still called each time
+        assert second.points == first.points
+
+    def test_memo_shared_across_instances(self, config, sample_messages):
+        mode = CountingMode()
+        Summarizer(config, mode, FakeClient()).summarize(sample_messages)
+        Summarizer(config, mode, FakeClient()).summarize(sample_messages)
+        assert mode.prompt_calls == 1
+
+    def test_same_ids_different_content_do_not_collide(self, sample_messages):
+        # Two tenants reusing the same message ids must never see each
+        # other's cached prompts; keys digest full content, not just ids.
+        mode = CountingMode()
+        tenant_a = Summarizer(SummarizerConfig(namespace="tenant-a"), mode, FakeClient())
+        tenant_b = Summarizer(SummarizerConfig(namespace="tenant-b"), mode, FakeClient())
+        other_messages = [
+            Message(id=m.id, role=m.role, content=f"confidential-{m.id}") for m in sample_messages
+        ]
+        tenant_a.summarize(sample_messages)
+        tenant_b.summarize(other_messages)
+
+        assert mode.prompt_calls == 2
+        prompt_b = tenant_b.client.prompts[0]
+        assert "confidential-m1" in prompt_b
+        assert sample_messages[0].content not in prompt_b
+
+
+class TestSummarizeMany:
+    async def test_batched_path_aligns_results_and_persists(self, config, sample_messages):
+        store = InMemoryStore()
+        mode = CountingMode()
+        summarizer = Summarizer(config, mode, FakeClient(), store=store)
+        batches = [sample_messages[:2], sample_messages[2:]]
+        results = await summarizer.summarize_many(batches)
+
+        assert len(results) == 2
+        assert all(r.created_at is not None for r in results)
+        # Canned attribution resolves against each batch's own window.
+        assert results[0].points[0].source_msg_ids == ["m1", "m2"]
+        assert results[1].points[0].source_msg_ids == []
+        assert store.save_calls == 2
+        assert [op for _, op, _ in store.logs] == ["summarize", "summarize"]
+        assert store.logs[0][2]["message_count"] == 2
+        assert store.logs[1][2]["message_count"] == 1
+
+    async def test_batched_path_reuses_memoized_prompts(self, config, sample_messages):
+        mode = CountingMode()
+        summarizer = Summarizer(config, mode, FakeClient())
+        await summarizer.summarize_many([sample_messages, sample_messages])
+        assert mode.prompt_calls == 1
@@ -0,0 +1,46 @@
+"""
+Unit tests for the batched store write entrypoint.
+"""
+
+from summarion.core.models import SummaryResult
+from summarion.stores import save_results
+from summarion.tests.conftest import InMemoryStore
+
+
+class BatchingStore(InMemoryStore):
+    """Store double with a native batched write."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_calls = 0
+
+    def save_results(self, namespace: str, results: list[tuple[SummaryResult, str]]) -> None:
+        self.batch_calls += 1
+        for result, memory_level in results:
+            self.saved[(namespace, memory_level)] = result
+
+
+def _pairs() -> list[tuple[SummaryResult, str]]:
+    return [
+        (SummaryResult(mode="pointwise", title="rolling"), "rolling"),
+        (SummaryResult(mode="pointwise", title="session"), "session"),
+    ]
+
+
+class TestSaveResults:
+    def test_falls_back_to_per_result_writes(self, memory_store):
+        save_results(memory_store, "ns", _pairs())
+        assert memory_store.save_calls == 2
+        assert memory_store.saved[("ns", "rolling")].title == "rolling"
+        assert memory_store.saved[("ns", "session")].title == "session"
+
+    def test_native_batch_write_is_preferred(self):
+        store = BatchingStore()
+        save_results(store, "ns", _pairs())
+        assert store.batch_calls == 1
+        assert store.save_calls == 0
+        assert store.saved[("ns", "session")].title == "session"
+
+    def test_empty_batch_is_a_no_op(self, memory_store):
+        save_results(memory_store, "ns", [])
+        assert memory_store.save_calls == 0